@@ -14,11 +14,18 @@ class InvalidParameterError(QuantumSimError):
         self: QuantumSimError, parameter, message: str = "Invalid parameter provided"
     ):
         self.parameter = parameter
-        self.message = message
-        super().__init__(self.message)
+        super().__init__(message)
+
+    @property
+    def message(self: QuantumSimError) -> str:
+        return self.args[0]
+
+    @message.setter
+    def message(self: QuantumSimError, value: str) -> None:
+        self.args = (value,) + self.args[1:]
 
     def __str__(self: QuantumSimError):
-        return f"{self.message}: {self.parameter}"
+        return f"{self.args[0]}: {self.parameter}"
 
 
 class SimulationError(QuantumSimError):
@@ -27,8 +34,15 @@ class SimulationError(QuantumSimError):
     def __init__(
         self: QuantumSimError, message: str = "An error occurred during the simulation"
     ):
-        self.message = message
-        super().__init__(self.message)
+        super().__init__(message)
+
+    @property
+    def message(self: QuantumSimError) -> str:
+        return self.args[0]
+
+    @message.setter
+    def message(self: QuantumSimError, value: str) -> None:
+        self.args = (value,) + self.args[1:]
 
     def __str__(self: QuantumSimError):
-        return self.message
+        return self.args[0]
@@ -1,6 +1,6 @@
 import numpy as np
 from quantum_sim.potentials.Potential import Potential
-from typing import Dict, Any
+from typing import Callable, Dict, Any
 
 
 class FreePotential(Potential):
@@ -10,22 +10,38 @@ class FreePotential(Potential):
     This is the simplest case, often used as a reference or for comparison.
     """
 
+    __slots__ = ()
+
+    is_zero = True
+
     def __init__(self):
         """Initialize free potential (no parameters needed)."""
         super().__init__()
 
-    def evaluate(self, x: float | np.ndarray) -> np.ndarray:
+    def evaluate(self, x: float | np.ndarray, dtype=None) -> np.ndarray:
         """
         Evaluate the potential: always returns 0.
 
         Args:
             x: Position(s) (ignored for free potential)
+            dtype: Floating dtype of the result (default: follows x)
 
         Returns:
-            Array of zeros with the same shape as x
+            Read-only array of zeros with the same shape as x (a broadcast
+            view, so no memory is allocated for the grid)
         """
         x_arr = np.asarray(x)
-        return np.zeros_like(x_arr)
+        zero = np.zeros((), dtype=self._result_dtype(x_arr, dtype))
+        return np.broadcast_to(zero, x_arr.shape)
+
+    def make_kernel(self) -> Callable[[float | np.ndarray], np.ndarray]:
+        """Return a closure evaluating the free potential in float64."""
+        zero = np.zeros(())
+
+        def kernel(x: float | np.ndarray) -> np.ndarray:
+            return np.broadcast_to(zero, np.shape(x))
+
+        return kernel
 
     @property
     def parameters(self) -> Dict[str, Any]:
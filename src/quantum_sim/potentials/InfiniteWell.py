@@ -1,6 +1,24 @@
 import numpy as np
 from quantum_sim.potentials.Potential import Potential
-from typing import Dict, Any
+from typing import Callable, Dict, Any
+
+
+def _fill_well(x_arr: np.ndarray, a, b, V_wall, dtype) -> np.ndarray:
+    """
+    Return 0 where a <= x_arr <= b and V_wall elsewhere.
+
+    a, b and V_wall may be arrays broadcasting against x_arr, which is how
+    the batch evaluation fills several wells at once.
+    """
+    # Complement of the inside mask, so a nan position gets the wall
+    inside = x_arr >= a
+    inside &= x_arr <= b
+    # copyto rather than a multiply: a V_wall too large for a narrow dtype
+    # must saturate to inf outside without turning 0 * inf into nan inside.
+    V = np.zeros(np.broadcast_shapes(inside.shape, np.shape(V_wall)), dtype=dtype)
+    with np.errstate(over="ignore"):
+        np.copyto(V, V_wall, casting="unsafe", where=~inside)
+    return V
 
 
 class InfiniteWell(Potential):
@@ -11,6 +29,8 @@ class InfiniteWell(Potential):
     In practice, we use a very large finite value instead of infinity.
     """
 
+    __slots__ = ("a", "b", "V_wall")
+
     def __init__(self, a: float, b: float, V_wall: float = 1e10):
         """
         Initialize infinite well potential.
@@ -27,18 +47,33 @@ class InfiniteWell(Potential):
         self.b = b
         self.V_wall = V_wall
 
-    def evaluate(self, x: float | np.ndarray) -> np.ndarray:
+    def evaluate(self, x: float | np.ndarray, dtype=None) -> np.ndarray:
         """
         Evaluate the potential.
 
         Args:
             x: Position(s)
+            dtype: Floating dtype of the result (default: follows x)
 
         Returns:
             0 inside [a, b], V_wall outside
         """
         x_arr = np.asarray(x)
-        return np.where((x_arr >= self.a) & (x_arr <= self.b), 0.0, self.V_wall)
+        return _fill_well(
+            x_arr, self.a, self.b, self.V_wall, self._result_dtype(x_arr, dtype)
+        )
+
+    def make_kernel(self) -> Callable[[float | np.ndarray], np.ndarray]:
+        """Return a closure evaluating this well in float64."""
+        a, b, V_wall = self.a, self.b, self.V_wall
+        V_wall_float = float(V_wall)
+
+        def kernel(x: float | np.ndarray) -> float | np.ndarray:
+            if type(x) in (float, int):
+                return 0.0 if a <= x <= b else V_wall_float
+            return _fill_well(np.asarray(x), a, b, V_wall, np.float64)
+
+        return kernel
 
     @property
     def parameters(self) -> Dict[str, Any]:
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 import numpy as np
-from typing import Dict, Any
+from typing import Callable, Dict, Any
 
 
 class Potential(ABC):
@@ -9,23 +9,51 @@ class Potential(ABC):
     A potential defines the energy landscape in which quantum particles evolve.
     """
 
+    __slots__ = ()
+
+    #: True when V(x) = 0 everywhere, so solvers may skip the V·ψ term.
+    is_zero: bool = False
+
     def __init__(self):
         """Initialize the potential."""
         pass
 
     @abstractmethod
-    def evaluate(self, x: float | np.ndarray) -> np.ndarray:
+    def evaluate(self, x: float | np.ndarray, dtype=None) -> np.ndarray:
         """
         Evaluate the potential at given position(s).
 
         Args:
             x: Position(s) where to evaluate the potential
+            dtype: Floating dtype of the result (default: follows x when it is
+                floating, float64 otherwise)
 
         Returns:
             Potential energy value(s) at x
         """
         pass
 
+    def make_kernel(self) -> Callable[[float | np.ndarray], np.ndarray]:
+        """
+        Return a function of x that evaluates this potential.
+
+        Subclasses override this with a closure over their parameters, so
+        repeated calls in a time-stepping loop only read local variables, and
+        may return a plain float for Python scalar input, skipping the ufunc
+        dispatch entirely. The default falls back to the bound evaluate method.
+
+        Returns:
+            Callable mapping position(s) to potential energy value(s)
+        """
+        return self.evaluate
+
+    @staticmethod
+    def _result_dtype(x_arr: np.ndarray, dtype=None) -> np.dtype:
+        """Resolve the dtype of an evaluation result."""
+        if dtype is not None:
+            return np.dtype(dtype)
+        return x_arr.dtype if x_arr.dtype.kind == "f" else np.dtype(np.float64)
+
     @property
     @abstractmethod
     def parameters(self) -> Dict[str, Any]:
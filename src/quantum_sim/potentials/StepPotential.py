@@ -1,6 +1,22 @@
 import numpy as np
 from quantum_sim.potentials.Potential import Potential
-from typing import Dict, Any
+from typing import Callable, Dict, Any
+
+
+def _fill_step(x_arr: np.ndarray, x0, V0, dtype) -> np.ndarray:
+    """
+    Return V0 where x_arr >= x0 and 0 elsewhere.
+
+    x0 and V0 may be arrays broadcasting against x_arr, which is how the
+    batch evaluation fills several steps at once.
+    """
+    above = x_arr >= x0
+    # copyto rather than a multiply: an infinite V0 (or one too large for a
+    # narrow dtype) must not turn 0 * inf into nan below the step.
+    V = np.zeros(np.broadcast_shapes(above.shape, np.shape(V0)), dtype=dtype)
+    with np.errstate(over="ignore"):
+        np.copyto(V, V0, casting="unsafe", where=above)
+    return V
 
 
 class StepPotential(Potential):
@@ -11,6 +27,8 @@ class StepPotential(Potential):
     and reflection at potential barriers.
     """
 
+    __slots__ = ("x0", "V0")
+
     def __init__(self, x0: float, V0: float):
         """
         Initialize step potential.
@@ -23,18 +41,31 @@ class StepPotential(Potential):
         self.x0 = x0
         self.V0 = V0
 
-    def evaluate(self, x: float | np.ndarray) -> np.ndarray:
+    def evaluate(self, x: float | np.ndarray, dtype=None) -> np.ndarray:
         """
         Evaluate the potential.
 
         Args:
             x: Position(s)
+            dtype: Floating dtype of the result (default: follows x)
 
         Returns:
             V0 where x >= x0, 0 otherwise
         """
         x_arr = np.asarray(x)
-        return np.where(x_arr >= self.x0, self.V0, 0.0)
+        return _fill_step(x_arr, self.x0, self.V0, self._result_dtype(x_arr, dtype))
+
+    def make_kernel(self) -> Callable[[float | np.ndarray], np.ndarray]:
+        """Return a closure evaluating this step potential in float64."""
+        x0, V0 = self.x0, self.V0
+        V0_float = float(V0)
+
+        def kernel(x: float | np.ndarray) -> float | np.ndarray:
+            if type(x) in (float, int):
+                return V0_float if x >= x0 else 0.0
+            return _fill_step(np.asarray(x), x0, V0, np.float64)
+
+        return kernel
 
     @property
     def parameters(self) -> Dict[str, Any]:
@@ -0,0 +1,92 @@
+import numpy as np
+from quantum_sim.potentials.Potential import Potential
+from quantum_sim.potentials.StepPotential import StepPotential, _fill_step
+from quantum_sim.potentials.InfiniteWell import InfiniteWell, _fill_well
+
+
+def _as_column(values, ndim: int) -> np.ndarray:
+    """Reshape per-potential parameters so they broadcast against a grid."""
+    return np.asarray(values, dtype=float).reshape((-1,) + (1,) * ndim)
+
+
+def evaluate_steps(x: float | np.ndarray, x0s, V0s) -> np.ndarray:
+    """
+    Evaluate several step potentials on the same grid in one pass.
+
+    Args:
+        x: Position(s)
+        x0s: Positions of the steps, one per potential
+        V0s: Heights of the steps, one per potential
+
+    Returns:
+        Array of shape (len(x0s),) + shape of x, row i being the i-th step
+    """
+    x_arr = np.asarray(x, dtype=float)
+    return _fill_step(
+        x_arr, _as_column(x0s, x_arr.ndim), _as_column(V0s, x_arr.ndim), float
+    )
+
+
+def evaluate_wells(x: float | np.ndarray, a_values, b_values, V_walls) -> np.ndarray:
+    """
+    Evaluate several infinite wells on the same grid in one pass.
+
+    Args:
+        x: Position(s)
+        a_values: Left boundaries, one per potential
+        b_values: Right boundaries, one per potential
+        V_walls: Potential outside each well, one per potential
+
+    Returns:
+        Array of shape (len(a_values),) + shape of x, row i being the i-th well
+    """
+    x_arr = np.asarray(x, dtype=float)
+    return _fill_well(
+        x_arr,
+        _as_column(a_values, x_arr.ndim),
+        _as_column(b_values, x_arr.ndim),
+        _as_column(V_walls, x_arr.ndim),
+        float,
+    )
+
+
+def evaluate_many(potentials: list[Potential], x: float | np.ndarray) -> np.ndarray:
+    """
+    Evaluate a list of potentials on the same grid.
+
+    Step potentials and infinite wells are gathered into parameter arrays and
+    evaluated together; any other potential falls back to its own evaluate().
+
+    Args:
+        potentials: Potentials to evaluate
+        x: Position(s)
+
+    Returns:
+        Array of shape (len(potentials),) + shape of x, in the input order
+    """
+    x_arr = np.asarray(x, dtype=float)
+    out = np.empty((len(potentials),) + x_arr.shape)
+
+    steps = [i for i, pot in enumerate(potentials) if type(pot) is StepPotential]
+    wells = [i for i, pot in enumerate(potentials) if type(pot) is InfiniteWell]
+
+    if steps:
+        out[steps] = evaluate_steps(
+            x_arr,
+            [potentials[i].x0 for i in steps],
+            [potentials[i].V0 for i in steps],
+        )
+    if wells:
+        out[wells] = evaluate_wells(
+            x_arr,
+            [potentials[i].a for i in wells],
+            [potentials[i].b for i in wells],
+            [potentials[i].V_wall for i in wells],
+        )
+
+    batched = set(steps) | set(wells)
+    for i, pot in enumerate(potentials):
+        if i not in batched:
+            out[i] = pot.evaluate(x_arr)
+
+    return out
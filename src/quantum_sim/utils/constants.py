@@ -1,10 +1,10 @@
 # src/quantum_sim/utils/constants.py
 
-import numpy as np
+import math
 
 # Physical constants
 PLANCK_CONSTANT = 6.62607015e-34  # in J·s
-PI = np.pi  # Dimensionless
+PI = math.pi  # Dimensionless
 REDUCED_PLANCK_CONSTANT = PLANCK_CONSTANT / (2 * PI)  # in J·s
 ELECTRON_MASS = 9.10938356e-31  # in kg
 SPEED_OF_LIGHT = 2.99792458e8  # in m/s
@@ -11,6 +11,8 @@ class GaussianWavePacket(WavePacket):
     in the momentum (k) space.
     """
 
+    __slots__ = ("k0", "sigma_k")
+
     def __init__(
         self,
         k_center: float,
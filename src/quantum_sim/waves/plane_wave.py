@@ -1,3 +1,5 @@
+import cmath
+
 import numpy as np
 
 from quantum_sim.waves import WaveFunction
@@ -11,6 +13,68 @@ from quantum_sim.validators.wave_validators import (
 )
 
 
+def _phase_factor(
+    u: float | np.ndarray,
+    rate: float,
+    offset: float,
+    amplitude: complex,
+    out: np.ndarray | None = None,
+    dtype=complex,
+) -> complex | np.ndarray:
+    """
+    Compute amplitude * exp(i(rate·u + offset)) in a single buffer.
+
+    The phase is accumulated in one contiguous real buffer, then cos and sin
+    are written straight into the real and imaginary parts of the output:
+    cheaper than a complex exp. Keeping the phase contiguous (rather than in
+    the strided imaginary view) lets NumPy use its SIMD sin/cos loops. The
+    amplitude is taken in polar form, its argument joining the phase offset,
+    so the final scaling is by a real modulus (and skipped when it is 1).
+
+    Args:
+        u: Real variable(s) the phase is linear in (position or time)
+        rate: Coefficient of u in the phase
+        offset: Constant part of the phase
+        amplitude: Complex amplitude
+        out: Optional complex array with the shape of u receiving the result
+        dtype: Complex dtype of the result; complex64 halves the memory
+            traffic at single precision
+
+    Returns:
+        The complex values as an array, written into out when it is given;
+        a plain complex when u is a scalar and no out is given
+    """
+    modulus, argument = cmath.polar(amplitude)
+    offset += argument
+
+    if out is None and dtype is complex and type(u) in (float, int):
+        # Plain Python scalars skip the 0-d array round trip entirely
+        return cmath.rect(modulus, rate * u + offset)
+
+    dtype = np.dtype(dtype)
+    if dtype.kind != "c":
+        raise ValueError(f"dtype must be a complex dtype, got {dtype}")
+    real_dtype = np.finfo(dtype).dtype
+    u_arr = np.asarray(u, dtype=real_dtype)
+    if out is not None and (out.shape != u_arr.shape or out.dtype != dtype):
+        raise ValueError(
+            f"out must be a {dtype} array of shape {u_arr.shape}, "
+            f"got {out.dtype} array of shape {out.shape}"
+        )
+
+    theta = np.multiply(u_arr, rate, out=np.empty(u_arr.shape, dtype=real_dtype))
+    theta += offset
+    psi = np.empty(u_arr.shape, dtype=dtype) if out is None else out
+    np.cos(theta, out=psi.real)
+    np.sin(theta, out=psi.imag)
+    if modulus != 1:
+        psi *= modulus
+
+    if out is not None:
+        return out
+    return psi if psi.ndim else complex(psi)
+
+
 class PlaneWave(WaveFunction):
     """
     Plane wave implementation:
@@ -18,6 +82,8 @@ class PlaneWave(WaveFunction):
     ψ(x,t) = A * exp(i(k(x - x₀) - ωt + φ))
     """
 
+    __slots__ = ("amplitude", "_wave_number", "phase", "_masse", "_angular_frequency")
+
     def __init__(
         self,
         amplitude: complex,
@@ -49,62 +115,166 @@ class PlaneWave(WaveFunction):
         """Validate parameters of the plane wave."""
         validate_non_negative(self.masse, "masse")
 
+    def _reset_cache(self) -> None:
+        """Drop cached derived quantities after a change of k or m."""
+        self._angular_frequency = None
+
+    @property
+    def wave_number(self) -> float:
+        """Wave number k."""
+        return self._wave_number
+
+    @wave_number.setter
+    def wave_number(self, value: float) -> None:
+        self._wave_number = value
+        self._reset_cache()
+
+    @property
+    def masse(self) -> float:
+        """Particle mass m."""
+        return self._masse
+
+    @masse.setter
+    def masse(self, value: float) -> None:
+        self._masse = value
+        self._reset_cache()
+
     @property
     def wavelength(self) -> float:
         """Wave number k = 2π / λ."""
-        return self.wave_number / (2 * PI)
+        return self._wave_number / (2 * PI)
 
     @property
     def angular_frequency(self) -> float:
-        """Calculate angular frequency ω = ħk²/(2m)."""
-        k = self.wave_number
-        return (REDUCED_PLANCK_CONSTANT * k**2) / (2 * self.masse)
+        """Calculate angular frequency ω = ħk²/(2m), cached until k or m change."""
+        if self._angular_frequency is None:
+            k = self._wave_number
+            self._angular_frequency = (
+                REDUCED_PLANCK_CONSTANT * k**2 / (2 * self._masse)
+            )
+        return self._angular_frequency
 
     @property
     def momentum(self) -> float:
         """Calculate momentum p = ħk."""
-        return REDUCED_PLANCK_CONSTANT * self.wave_number
+        return REDUCED_PLANCK_CONSTANT * self._wave_number
 
     @property
     def energy(self) -> float:
         """Calculate energy E = p²/(2m)."""
         p = self.momentum
-        return p**2 / (2 * self.masse)
+        return p**2 / (2 * self._masse)
 
     @property
     def phase_velocity(self) -> float:
         """Calculate phase velocity v_p = ω/k."""
-        return self.angular_frequency / self.wave_number
+        return self.angular_frequency / self._wave_number
 
     @property
     def period(self) -> float:
         """Calculate period T = 2π/ω."""
         return 2 * PI / self.angular_frequency
 
-    def evaluate(self, x: float | np.ndarray) -> np.ndarray:
-        """Evaluate plane wave."""
-        return self.amplitude * np.exp(
-            1j
-            * (
-                self.wave_number * (x - self.position)
-                - self.angular_frequency * self.time
-                + self.phase
-            )
-        )
+    def evaluate(
+        self, x: float | np.ndarray, out: np.ndarray | None = None, dtype=complex
+    ) -> complex | np.ndarray:
+        """
+        Evaluate plane wave.
 
-    def evaluate_at_time_zero(self, x: float | np.ndarray) -> np.ndarray:
-        """Evaluate wave at t = 0."""
-        return self.amplitude * np.exp(
-            1j * (self.wave_number * (x - self.position) + self.phase)
-        )
+        Args:
+            x: Position(s)
+            out: Optional complex array with the shape of x that receives the
+                result, so a caller evaluating repeatedly can reuse one buffer
+            dtype: Complex dtype of the result (default: complex128); pass
+                np.complex64 when single precision is enough
+
+        Returns:
+            ψ(x, t): a complex for scalar x, otherwise an array (written into
+            out when it is given)
+        """
+        k = self._wave_number
+        phase0 = self.phase - k * self.position - self.angular_frequency * self.time
+        return _phase_factor(x, k, phase0, self.amplitude, out, dtype)
+
+    def evaluate_spacetime(
+        self,
+        x: float | np.ndarray,
+        t: float | np.ndarray,
+        out: np.ndarray | None = None,
+        dtype=complex,
+    ) -> np.ndarray:
+        """
+        Evaluate the wave on every (x, t) pair of a space-time grid.
 
-    def evaluate_at_position_zero(self, t: float | np.ndarray) -> np.ndarray:
-        """Evaluate wave at x = 0."""
-        return self.amplitude * np.exp(
-            1j
-            * (
-                -self.wave_number * self.position
-                - self.angular_frequency * t
-                + self.phase
+        The wave factorizes as A·exp(i(k(x - x₀) + φ)) · exp(-iωt), so only
+        one spatial and one temporal vector are computed, and the grid is
+        their outer product.
+
+        Args:
+            x: Positions
+            t: Times (the time attribute of the wave is not used)
+            out: Optional complex array of shape x.shape + t.shape receiving
+                the result
+            dtype: Complex dtype of the result (default: complex128)
+
+        Returns:
+            Array of shape x.shape + t.shape with ψ(x[i], t[j]) at [i, j]
+        """
+        k = self._wave_number
+        phase0 = self.phase - k * self.position
+        dtype = np.dtype(dtype)
+        shape = np.shape(x) + np.shape(t)
+        if out is not None and (out.shape != shape or out.dtype != dtype):
+            raise ValueError(
+                f"out must be a {dtype} array of shape {shape}, "
+                f"got {out.dtype} array of shape {out.shape}"
             )
-        )
+
+        # Evaluated at least 1-D and reshaped back, so a scalar x or t yields a
+        # 0-d dtype array rather than a Python complex, which would promote
+        # the product to complex128
+        spatial = _phase_factor(
+            np.atleast_1d(x), k, phase0, self.amplitude, None, dtype
+        ).reshape(np.shape(x))
+        temporal = _phase_factor(
+            np.atleast_1d(t), -self.angular_frequency, 0.0, 1.0, None, dtype
+        ).reshape(np.shape(t))
+        return np.multiply.outer(spatial, temporal, out=out)
+
+    def evaluate_at_time_zero(
+        self, x: float | np.ndarray, out: np.ndarray | None = None, dtype=complex
+    ) -> complex | np.ndarray:
+        """
+        Evaluate wave at t = 0.
+
+        Args:
+            x: Position(s)
+            out: Optional complex array with the shape of x receiving the result
+            dtype: Complex dtype of the result (default: complex128)
+
+        Returns:
+            ψ(x, 0): a complex for scalar x, otherwise an array (written into
+            out when it is given)
+        """
+        k = self._wave_number
+        phase0 = self.phase - k * self.position
+        return _phase_factor(x, k, phase0, self.amplitude, out, dtype)
+
+    def evaluate_at_position_zero(
+        self, t: float | np.ndarray, out: np.ndarray | None = None, dtype=complex
+    ) -> complex | np.ndarray:
+        """
+        Evaluate wave at x = 0.
+
+        Args:
+            t: Time(s)
+            out: Optional complex array with the shape of t receiving the result
+            dtype: Complex dtype of the result (default: complex128)
+
+        Returns:
+            ψ(0, t): a complex for scalar t, otherwise an array (written into
+            out when it is given)
+        """
+        phase0 = self.phase - self._wave_number * self.position
+        omega = self.angular_frequency
+        return _phase_factor(t, -omega, phase0, self.amplitude, out, dtype)
@@ -3,6 +3,7 @@ import numpy as np
 from scipy import sparse
 from scipy.integrate import solve_ivp
 
+from quantum_sim.potentials.Potential import Potential
 from quantum_sim.utils.constants import REDUCED_PLANCK_CONSTANT, ELECTRON_MASS
 from quantum_sim.waves.wave_packet import WavePacket
 
@@ -43,6 +44,7 @@ class SchrodingerSolver:
 
 
         self._V: np.ndarray = np.zeros(n_points, dtype=float)
+        self._V_is_zero: bool = True
 
         self._psi_0: np.ndarray | None = None
 
@@ -75,15 +77,27 @@ class SchrodingerSolver:
                 ) ** 2
         return V_cap
 
-    def set_potential(self, V: np.ndarray) -> None:
-        """Set the potential V(x)."""
+    def set_potential(self, V: np.ndarray | Potential) -> None:
+        """
+        Set the potential V(x), either as values on the grid or as a
+        Potential evaluated on the grid.
+        """
 
-        V = np.asarray(V, dtype=float)
+        if isinstance(V, Potential):
+            if V.is_zero:
+                self._V = np.zeros(self.n_points, dtype=float)
+                self._V_is_zero = True
+                return
+            V = V.evaluate(self.x_grid)
+        # Private copy: _V_is_zero is computed once here, so later in-place
+        # edits to the caller's array must not reach _rhs.
+        V = np.array(V, dtype=float)
         if V.shape != (self.n_points,):
             raise ValueError(
                 f"V must have shape ({self.n_points},), got {V.shape}"
             )
         self._V = V
+        self._V_is_zero = not V.any()
 
     def init_from_packet(self, packet: WavePacket) -> None:
         """
@@ -118,11 +132,18 @@ class SchrodingerSolver:
         dψ/dt = (-i/ℏ)(T + V)ψ − Γ(x)ψ  where Γ is the CAP absorption term.
         """
         hbar = REDUCED_PLANCK_CONSTANT
-        kinetic = -(hbar ** 2 / (2.0 * self.mass)) * self._laplacian.dot(psi)
-        potential_term = self._V * psi
-        hamiltonian_psi = kinetic + potential_term
-        absorption = self._cap * psi
-        return (-1j / hbar) * hamiltonian_psi - absorption
+        # A real ψ would give a real Laplacian product, which the in-place
+        # complex scalings below cannot write into
+        psi = np.asarray(psi, dtype=complex)
+        # Every scaling is applied in place on the Laplacian product, which
+        # is the only full-length array allocated besides the V·ψ and Γ·ψ terms
+        dpsi_dt = self._laplacian.dot(psi)
+        dpsi_dt *= -(hbar ** 2 / (2.0 * self.mass))
+        if not self._V_is_zero:
+            dpsi_dt += self._V * psi
+        dpsi_dt *= -1j / hbar
+        dpsi_dt -= self._cap * psi
+        return dpsi_dt
 
     def solve(
         self,
@@ -7,6 +7,8 @@ from quantum_sim.validators.wave_validators import validate_positive, validate_r
 class WaveFunction(ABC):
     """Abstract base class for quantum wave functions."""
 
+    __slots__ = ("position", "time")
+
     def __init__(self, position: float | None, time: float = 0.0):
         """
         Initialize the wave function.
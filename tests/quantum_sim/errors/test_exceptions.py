@@ -94,3 +94,16 @@ def test_simulation_error_message_attribute_default():
     with pytest.raises(SimulationError) as exc_info:
         raise SimulationError()
     assert exc_info.value.message == "An error occurred during the simulation"
+
+
+@pytest.mark.unit
+def test_exception_message_is_assignable():
+    invalid = InvalidParameterError("invalid_value")
+    invalid.message = "Parameter is not valid"
+    assert invalid.message == "Parameter is not valid"
+    assert str(invalid) == "Parameter is not valid: invalid_value"
+
+    simulation = SimulationError()
+    simulation.message = "Simulation failed"
+    assert simulation.message == "Simulation failed"
+    assert str(simulation) == "Simulation failed"
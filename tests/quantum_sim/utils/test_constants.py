@@ -1,3 +1,5 @@
+import math
+
 import numpy as np
 import pytest
 from quantum_sim.utils.constants import (
@@ -14,19 +16,19 @@ class TestPhysicalConstants:
 
     def test_planck_constant_value(self):
         """Test Planck constant has correct value in J·s."""
-        assert PLANCK_CONSTANT == pytest.approx(6.62607015e-34)
+        assert PLANCK_CONSTANT == 6.62607015e-34
 
     def test_planck_constant_positive(self):
         """Test Planck constant is positive."""
         assert PLANCK_CONSTANT > 0
 
     def test_pi_value(self):
-        """Test PI constant matches numpy.pi."""
-        assert PI == pytest.approx(np.pi)
+        """Test PI constant matches math.pi."""
+        assert PI == math.pi
 
     def test_reduced_planck_constant_value(self):
         """Test reduced Planck constant has correct value."""
-        expected = PLANCK_CONSTANT / (2 * np.pi)
+        expected = PLANCK_CONSTANT / math.tau
         assert REDUCED_PLANCK_CONSTANT == pytest.approx(expected)
 
     def test_reduced_planck_constant_positive(self):
@@ -39,7 +41,7 @@ class TestPhysicalConstants:
 
     def test_electron_mass_value(self):
         """Test electron mass has correct value in kg."""
-        assert ELECTRON_MASS == pytest.approx(9.10938356e-31)
+        assert ELECTRON_MASS == 9.10938356e-31
 
     def test_electron_mass_positive(self):
         """Test electron mass is positive."""
@@ -47,7 +49,7 @@ class TestPhysicalConstants:
 
     def test_speed_of_light_value(self):
         """Test speed of light has correct value in m/s."""
-        assert SPEED_OF_LIGHT == pytest.approx(2.99792458e8)
+        assert SPEED_OF_LIGHT == 2.99792458e8
 
     def test_speed_of_light_positive(self):
         """Test speed of light is positive."""
@@ -7,15 +7,28 @@ from quantum_sim.validators import (
 from quantum_sim.errors import InvalidParameterError
 import pytest
 
+_POS_OK = (0.1, 100)
+_POS_OK_IDS = ("fraction", "large-int")
+_POS_BAD = (0, -1, -0.0001)
+_POS_BAD_IDS = ("zero", "negative", "tiny-negative")
+_NN_OK = (0, 1.5)
+_NN_OK_IDS = ("zero", "float")
+_NN_BAD = (-0.1, -1)
+_NN_BAD_IDS = ("negative-float", "negative-int")
+_RANGE_OK = ((5, 0, 10), (0, 0, 0), (3.5, 1.5, 4.0))
+_RANGE_OK_IDS = ("inside", "degenerate", "float-bounds")
+_RANGE_BAD = ((-1, 0, 5), (6, 0, 5), (10.1, 0, 10))
+_RANGE_BAD_IDS = ("below", "above", "just-above")
+
 
 @pytest.mark.unit
-@pytest.mark.parametrize("value", [1, 0.1, 100])
+@pytest.mark.parametrize("value", _POS_OK, ids=_POS_OK_IDS)
 def test_validate_positive_valid(value):
     assert validate_positive(value) is True
 
 
 @pytest.mark.unit
-@pytest.mark.parametrize("value", [0, -1, -0.0001])
+@pytest.mark.parametrize("value", _POS_BAD, ids=_POS_BAD_IDS)
 def test_validate_positive_invalid(value):
     with pytest.raises(InvalidParameterError) as exc_info:
         validate_positive(value)
@@ -32,13 +45,13 @@ def test_validate_positive_custom_parameter_name():
 
 
 @pytest.mark.unit
-@pytest.mark.parametrize("value", [0, 1, 1.5])
+@pytest.mark.parametrize("value", _NN_OK, ids=_NN_OK_IDS)
 def test_validate_non_negative_valid(value):
     assert validate_non_negative(value) is True
 
 
 @pytest.mark.unit
-@pytest.mark.parametrize("value", [-0.1, -1])
+@pytest.mark.parametrize("value", _NN_BAD, ids=_NN_BAD_IDS)
 def test_validate_non_negative_invalid(value):
     with pytest.raises(InvalidParameterError) as exc_info:
         validate_non_negative(value, parameter_name="x")
@@ -47,13 +60,13 @@ def test_validate_non_negative_invalid(value):
 
 
 @pytest.mark.unit
-@pytest.mark.parametrize("value,minv,maxv", [(5, 0, 10), (0, 0, 0), (3.5, 1.5, 4.0)])
+@pytest.mark.parametrize("value,minv,maxv", _RANGE_OK, ids=_RANGE_OK_IDS)
 def test_validate_range_valid(value, minv, maxv):
     assert validate_range(value, minv, maxv) is True
 
 
 @pytest.mark.unit
-@pytest.mark.parametrize("value,minv,maxv", [(-1, 0, 5), (6, 0, 5), (10.1, 0, 10)])
+@pytest.mark.parametrize("value,minv,maxv", _RANGE_BAD, ids=_RANGE_BAD_IDS)
 def test_validate_range_invalid(value, minv, maxv):
     with pytest.raises(InvalidParameterError) as exc_info:
         validate_range(value, minv, maxv, parameter_name="range_param")
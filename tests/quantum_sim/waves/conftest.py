@@ -0,0 +1,78 @@
+# tests/quantum_sim/waves/conftest.py
+import numpy as np
+import pytest
+
+from quantum_sim.waves import PlaneWave
+
+
+def _frozen(grid):
+    """Make a shared grid read-only so no test can alter it for the others."""
+    grid.flags.writeable = False
+    return grid
+
+
+@pytest.fixture(scope="session")
+def assert_complex_close():
+    """
+    Fixture providing an absolute-tolerance check for large complex arrays.
+
+    A single max-abs-diff reduction, cheaper than np.allclose, which also
+    computes the relative term for every element.
+    """
+
+    def check(actual, expected, tol=1e-12):
+        max_diff = float(np.max(np.abs(np.subtract(actual, expected))))
+        assert max_diff < tol, f"max |actual - expected| = {max_diff} >= {tol}"
+
+    return check
+
+
+@pytest.fixture(scope="session")
+def eval_grid_5():
+    """Fixture providing five points spaced by 0.5 from 0 to 2."""
+    return _frozen(np.array([0.0, 0.5, 1.0, 1.5, 2.0]))
+
+
+@pytest.fixture(scope="session")
+def grid_linspace_11():
+    """Fixture providing 11 evenly spaced points on [-1, 1]."""
+    return _frozen(np.linspace(-1.0, 1.0, 11))
+
+
+@pytest.fixture(scope="session")
+def grid_linspace_100():
+    """Fixture providing 100 evenly spaced points on [0, 10]."""
+    return _frozen(np.linspace(0, 10, 100))
+
+
+@pytest.fixture(scope="session")
+def grid_linspace_256():
+    """Fixture providing 256 evenly spaced points on [-100, 100]."""
+    return _frozen(np.linspace(-100, 100, 256))
+
+
+@pytest.fixture(scope="session")
+def grid_linspace_10k():
+    """Fixture providing 10000 evenly spaced points on [-100, 100]."""
+    return _frozen(np.linspace(-100, 100, 10000))
+
+
+@pytest.fixture(scope="session")
+def canonical_wave():
+    """Fixture providing the unit plane wave exp(ix) at t = 0."""
+    return PlaneWave(1.0, 1.0, 0.0, 0.0, 0.0)
+
+
+@pytest.fixture(scope="session")
+def wave_factory():
+    """
+    Fixture providing a plane wave builder with a unit default amplitude.
+
+    Every call returns a fresh instance, so a test may mutate its wave
+    without affecting any other test.
+    """
+
+    def make(wave_number, amplitude=1.0 + 0.0j, **kwargs):
+        return PlaneWave(amplitude, wave_number, **kwargs)
+
+    return make
@@ -1,29 +1,57 @@
 # tests/quantum_sim/waves/test_plane_wave.py
+import cmath
+import math
+from types import SimpleNamespace
+
 from quantum_sim.waves import PlaneWave
+from quantum_sim.waves.wave_function import WaveFunction
 from quantum_sim.utils.constants import ELECTRON_MASS, REDUCED_PLANCK_CONSTANT, PI
 from quantum_sim.errors.exceptions import InvalidParameterError
 import pytest
 from pytest import fixture
 import numpy as np
 
-
-@fixture
-def plane_wave_params():
-    """Fixture providing standard plane wave parameters."""
-    amplitude = 1.0 + 0.0j
-    wave_number = 5.0
-    position = 0.0
-    phase = 0.0
-    time = 0.0
-    masse = ELECTRON_MASS
-    return amplitude, wave_number, position, phase, time, masse
-
-
-@fixture
-def plane_wave(plane_wave_params):
+# Standard parameters: amplitude, wave_number, position, phase, time, masse
+_PW_PARAMS = (1.0 + 0.0j, 5.0, 0.0, 0.0, 0.0, ELECTRON_MASS)
+_WAVE_NUMBERS = (1.0, 5.0, 8.0, 20.0)
+_EDGE = pytest.mark.edge
+_STORE_CASES = (
+    pytest.param("amplitude", 3.0 + 4.0j, id="amplitude"),
+    pytest.param("wave_number", 7.5, id="wave_number"),
+    pytest.param("position", 3.5, id="position"),
+    pytest.param("phase", 1.5, id="phase"),
+    pytest.param("time", 2.5, id="time"),
+    pytest.param("masse", 1.0e-30, id="masse"),
+    pytest.param("wave_number", 1e-10, marks=_EDGE, id="tiny-wave-number"),
+    pytest.param("wave_number", 1e10, marks=_EDGE, id="huge-wave-number"),
+    pytest.param("position", -10.0, marks=_EDGE, id="negative-position"),
+    pytest.param("phase", -PI, marks=_EDGE, id="negative-phase"),
+    pytest.param("time", -1.0, marks=_EDGE, id="negative-time"),
+    pytest.param("amplitude", 0.0 + 0.0j, marks=_EDGE, id="zero-amplitude"),
+)
+
+
+@fixture(scope="module")
+def plane_wave():
     """Fixture providing a standard plane wave instance."""
-    amplitude, wave_number, position, phase, time, masse = plane_wave_params
-    return PlaneWave(amplitude, wave_number, position, phase, time, masse)
+    return PlaneWave(*_PW_PARAMS)
+
+
+@fixture(scope="module", params=_WAVE_NUMBERS)
+def plane_wave_bundle(request):
+    """Fixture providing a unit plane wave per wave number with its expected quantities."""
+    k = request.param
+    omega = REDUCED_PLANCK_CONSTANT * k * k / (2 * ELECTRON_MASS)
+    p = REDUCED_PLANCK_CONSTANT * k
+    return SimpleNamespace(
+        wave=PlaneWave(1.0 + 0.0j, k),
+        k=k,
+        omega=omega,
+        p=p,
+        e=p * p / (2 * ELECTRON_MASS),
+        vp=omega / k,
+        T=2 * PI / omega,
+    )
 
 
 # ========================
@@ -32,58 +60,39 @@ def plane_wave(plane_wave_params):
 
 
 @pytest.mark.unit
-def test_plane_wave_initialization(plane_wave_params):
-    """Test that PlaneWave initializes with correct parameters."""
-    amplitude, wave_number, position, phase, time, masse = plane_wave_params
-    wave = PlaneWave(amplitude, wave_number, position, phase, time, masse)
+def test_plane_wave_initialization(plane_wave):
+    """Test that PlaneWave stores all explicit positional parameters."""
+    amplitude, wave_number, position, phase, time, masse = _PW_PARAMS
 
-    assert wave.amplitude == amplitude
-    assert wave.wave_number == wave_number
-    assert wave.position == position
-    assert wave.phase == phase
-    assert wave.masse == masse
-    assert wave.time == time
+    assert plane_wave.amplitude == amplitude
+    assert plane_wave.wave_number == wave_number
+    assert plane_wave.position == position
+    assert plane_wave.phase == phase
+    assert plane_wave.masse == masse
+    assert plane_wave.time == time
 
 
 @pytest.mark.unit
 def test_plane_wave_default_parameters():
     """Test that PlaneWave initializes with default parameters."""
-    amplitude = 1.0 + 0.0j
-    wave_number = 5.0
+    wave = PlaneWave(1.0 + 0.0j, 5.0)
 
-    wave = PlaneWave(amplitude, wave_number)
-
-    assert np.isclose(wave.position, 0.0)
-    assert np.isclose(wave.phase, 0.0)
-    assert np.isclose(wave.time, 0.0)
-    assert np.isclose(wave.masse, ELECTRON_MASS)
+    assert wave.position == 0.0
+    assert wave.phase == 0.0
+    assert wave.time == 0.0
+    assert wave.masse == ELECTRON_MASS
 
 
 @pytest.mark.unit
-def test_plane_wave_complex_amplitude():
+def test_plane_wave_complex_amplitude(wave_factory):
     """Test that PlaneWave accepts complex amplitude."""
     amplitude = 2.0 + 3.0j
-    wave_number = 5.0
 
-    wave = PlaneWave(amplitude, wave_number)
+    wave = wave_factory(5.0, amplitude=amplitude)
 
     assert wave.amplitude == amplitude
-    assert np.isclose(wave.amplitude.real, 2.0)
-    assert np.isclose(wave.amplitude.imag, 3.0)
-
-
-@pytest.mark.unit
-def test_plane_wave_with_all_parameters(plane_wave_params):
-    """Test initialization with all explicit parameters."""
-    amplitude, wave_number, position, phase, time, masse = plane_wave_params
-    wave = PlaneWave(amplitude, wave_number, position, phase, time, masse)
-
-    assert wave.amplitude == amplitude
-    assert wave.wave_number == wave_number
-    assert wave.position == position
-    assert wave.phase == phase
-    assert wave.time == time
-    assert wave.masse == masse
+    assert wave.amplitude.real == 2.0
+    assert wave.amplitude.imag == 3.0
 
 
 # ========================
@@ -109,14 +118,10 @@ def test_validate_negative_mass():
 
 
 @pytest.mark.unit
-def test_validate_zero_mass():
+def test_validate_zero_mass(wave_factory):
     """Test that zero mass is allowed (non-negative)."""
-    amplitude = 1.0 + 0.0j
-    wave_number = 5.0
-    masse = 0.0
-
-    wave = PlaneWave(amplitude, wave_number, masse=masse)
-    assert np.isclose(wave.masse, 0.0)
+    wave = wave_factory(5.0, masse=0.0)
+    assert wave.masse == 0.0
 
 
 # ========================
@@ -125,140 +130,119 @@ def test_validate_zero_mass():
 
 
 @pytest.mark.unit
-def test_angular_frequency_calculation(plane_wave):
+def test_angular_frequency_calculation(plane_wave_bundle):
     """Test that angular frequency is calculated correctly: ω = ħk²/(2m)."""
-    k = plane_wave.wave_number
-    expected_omega = (REDUCED_PLANCK_CONSTANT * k**2) / (2 * plane_wave.masse)
-    calculated_omega = plane_wave.angular_frequency
-
-    assert np.isclose(calculated_omega, expected_omega)
+    b = plane_wave_bundle
+    assert math.isclose(b.wave.angular_frequency, b.omega)
 
 
 @pytest.mark.unit
-def test_angular_frequency_depends_on_wave_number():
+def test_angular_frequency_depends_on_wave_number(plane_wave, wave_factory):
     """Test that angular frequency depends on wave_number."""
-    amplitude = 1.0 + 0.0j
-    wave1 = PlaneWave(amplitude, wave_number=5.0)
-    wave2 = PlaneWave(amplitude, wave_number=10.0)
+    wave1 = plane_wave
+    wave2 = wave_factory(10.0)
 
     omega1 = wave1.angular_frequency
     omega2 = wave2.angular_frequency
 
-    assert not np.isclose(omega1, omega2)
+    assert not math.isclose(omega1, omega2)
 
 
 @pytest.mark.unit
-def test_angular_frequency_depends_on_mass():
+def test_angular_frequency_depends_on_mass(plane_wave, wave_factory):
     """Test that angular frequency depends on particle mass."""
-    amplitude = 1.0 + 0.0j
-    wave_number = 5.0
-
-    wave1 = PlaneWave(amplitude, wave_number, masse=ELECTRON_MASS)
-    wave2 = PlaneWave(amplitude, wave_number, masse=2 * ELECTRON_MASS)
+    wave1 = plane_wave
+    wave2 = wave_factory(5.0, masse=2 * ELECTRON_MASS)
 
     omega1 = wave1.angular_frequency
     omega2 = wave2.angular_frequency
 
-    assert np.isclose(omega2, omega1 / 2)
+    assert math.isclose(omega2, omega1 / 2)
 
 
 @pytest.mark.unit
-def test_angular_frequency_proportional_to_k_squared():
+def test_angular_frequency_proportional_to_k_squared(wave_factory):
     """Test that angular frequency is proportional to k²."""
-    amplitude = 1.0 + 0.0j
-    wave1 = PlaneWave(amplitude, wave_number=10.0)
-    wave2 = PlaneWave(amplitude, wave_number=5.0)
+    ks = np.array(_WAVE_NUMBERS)
+    omegas = np.array([wave_factory(k).angular_frequency for k in _WAVE_NUMBERS])
 
-    k1 = wave1.wave_number
-    k2 = wave2.wave_number
+    np.testing.assert_allclose(omegas / ks**2, omegas[0] / ks[0] ** 2)
 
-    omega1 = wave1.angular_frequency
-    omega2 = wave2.angular_frequency
 
-    expected_ratio = (k2**2) / (k1**2)
-    actual_ratio = omega2 / omega1
-
-    assert np.isclose(actual_ratio, expected_ratio)
+@pytest.mark.unit
+def test_angular_frequency_positive(plane_wave_bundle):
+    """Test that angular frequency is positive for positive mass and wave_number."""
+    assert plane_wave_bundle.wave.angular_frequency > 0
 
 
 @pytest.mark.unit
-def test_angular_frequency_positive():
-    """Test that angular frequency is positive for positive mass and wave_number."""
+def test_angular_frequency_follows_parameter_changes():
+    """Test that cached derived quantities are refreshed when k or m change."""
     amplitude = 1.0 + 0.0j
-    wave_number = 5.0
-    wave = PlaneWave(amplitude, wave_number)
-
+    wave = PlaneWave(amplitude, wave_number=5.0)
     omega = wave.angular_frequency
-    assert omega > 0
 
+    wave.wave_number = 10.0
+    assert math.isclose(wave.angular_frequency, 4 * omega)
 
-# ========================
-# Attribute Storage Tests
-# ========================
+    wave.masse = 2 * wave.masse
+    assert math.isclose(wave.angular_frequency, 2 * omega)
 
 
 @pytest.mark.unit
-def test_plane_wave_stores_amplitude():
-    """Test that amplitude is correctly stored."""
-    amplitude = 3.0 + 4.0j
-    wave_number = 5.0
-    wave = PlaneWave(amplitude, wave_number)
+def test_plane_wave_has_no_instance_dict(plane_wave):
+    """Test that PlaneWave stores its state in slots only."""
+    assert not hasattr(plane_wave, "__dict__")
+    with pytest.raises(AttributeError):
+        plane_wave.wavelenght = 1.0
 
-    assert wave.amplitude == amplitude
 
+# ========================
+# Derived Quantity Tests
+# ========================
 
-@pytest.mark.unit
-def test_plane_wave_stores_wave_number():
-    """Test that wave_number is correctly stored."""
-    amplitude = 1.0 + 0.0j
-    wave_number = 7.5
-    wave = PlaneWave(amplitude, wave_number)
 
-    assert np.isclose(wave.wave_number, wave_number)
+@pytest.mark.unit
+def test_momentum(plane_wave_bundle):
+    """Test that momentum is p = ħk."""
+    b = plane_wave_bundle
+    assert math.isclose(b.wave.momentum, b.p)
 
 
 @pytest.mark.unit
-def test_plane_wave_stores_position():
-    """Test that position is correctly stored."""
-    amplitude = 1.0 + 0.0j
-    wave_number = 5.0
-    position = 3.5
-    wave = PlaneWave(amplitude, wave_number, position=position)
-
-    assert np.isclose(wave.position, position)
+def test_energy(plane_wave_bundle):
+    """Test that energy is E = p²/(2m)."""
+    b = plane_wave_bundle
+    assert math.isclose(b.wave.energy, b.e)
 
 
 @pytest.mark.unit
-def test_plane_wave_stores_phase():
-    """Test that phase is correctly stored."""
-    amplitude = 1.0 + 0.0j
-    wave_number = 5.0
-    phase = 1.5
-    wave = PlaneWave(amplitude, wave_number, phase=phase)
-
-    assert np.isclose(wave.phase, phase)
+def test_phase_velocity(plane_wave_bundle):
+    """Test that phase velocity is v_p = ω/k."""
+    b = plane_wave_bundle
+    assert math.isclose(b.wave.phase_velocity, b.vp)
 
 
 @pytest.mark.unit
-def test_plane_wave_stores_time():
-    """Test that time is correctly stored."""
-    amplitude = 1.0 + 0.0j
-    wave_number = 5.0
-    time = 2.5
-    wave = PlaneWave(amplitude, wave_number, time=time)
+def test_period(plane_wave_bundle):
+    """Test that period is T = 2π/ω."""
+    b = plane_wave_bundle
+    assert math.isclose(b.wave.period, b.T)
 
-    assert np.isclose(wave.time, time)
+
+# ========================
+# Attribute Storage Tests
+# ========================
 
 
 @pytest.mark.unit
-def test_plane_wave_stores_mass():
-    """Test that mass is correctly stored."""
-    amplitude = 1.0 + 0.0j
-    wave_number = 5.0
-    masse = 1.0e-30
-    wave = PlaneWave(amplitude, wave_number, masse=masse)
+@pytest.mark.parametrize("attr,value", _STORE_CASES)
+def test_plane_wave_stores(wave_factory, attr, value):
+    """Test that each constructor argument, extreme values included, is stored."""
+    kwargs = {"wave_number": 5.0, attr: value}
+    wave = wave_factory(**kwargs)
 
-    assert np.isclose(wave.masse, masse)
+    assert getattr(wave, attr) == value
 
 
 # ========================
@@ -269,8 +253,6 @@ def test_plane_wave_stores_mass():
 @pytest.mark.unit
 def test_plane_wave_inherits_from_wave_function(plane_wave):
     """Test that PlaneWave inherits from WaveFunction."""
-    from quantum_sim.waves.wave_function import WaveFunction
-
     assert isinstance(plane_wave, WaveFunction)
 
 
@@ -281,124 +263,29 @@ def test_plane_wave_has_evaluate_method(plane_wave):
     assert callable(plane_wave.evaluate)
 
 
-# ========================
-# Edge Cases Tests
-# ========================
-
-
-@pytest.mark.unit
-def test_plane_wave_with_very_small_wavelength():
-    """Test PlaneWave with very small wavelength."""
-    amplitude = 1.0 + 0.0j
-    wave_number = 1e-10
-    wave = PlaneWave(amplitude, wave_number)
-
-    assert np.isclose(wave.wave_number, wave_number)
-    k = wave.wave_number
-    assert k > 0
-
-
-@pytest.mark.unit
-def test_plane_wave_with_very_large_wave_number():
-    """Test PlaneWave with very large wave_number."""
-    amplitude = 1.0 + 0.0j
-    wave_number = 1e10
-    wave = PlaneWave(amplitude, wave_number)
-
-    assert np.isclose(wave.wave_number, wave_number)
-
-
-@pytest.mark.unit
-def test_plane_wave_with_negative_position():
-    """Test PlaneWave with negative position offset."""
-    amplitude = 1.0 + 0.0j
-    wave_number = 5.0
-    position = -10.0
-    wave = PlaneWave(amplitude, wave_number, position=position)
-
-    assert np.isclose(wave.position, position)
-
-
-@pytest.mark.unit
-def test_plane_wave_with_negative_phase():
-    """Test PlaneWave with negative phase."""
-    amplitude = 1.0 + 0.0j
-    wave_number = 5.0
-    phase = -np.pi
-    wave = PlaneWave(amplitude, wave_number, phase=phase)
-
-    assert np.isclose(wave.phase, phase)
-
-
-@pytest.mark.unit
-def test_plane_wave_with_negative_time():
-    """Test PlaneWave with negative time (allowed)."""
-    amplitude = 1.0 + 0.0j
-    wave_number = 5.0
-    time = -1.0
-    wave = PlaneWave(amplitude, wave_number, time=time)
-
-    assert np.isclose(wave.time, time)
-
-
-@pytest.mark.unit
-def test_plane_wave_with_zero_amplitude():
-    """Test PlaneWave with zero amplitude."""
-    amplitude = 0.0 + 0.0j
-    wave_number = 5.0
-    wave = PlaneWave(amplitude, wave_number)
-
-    assert np.isclose(wave.amplitude, amplitude)
-
-
 # ========================
 # Physical Correctness Tests
 # ========================
 
 
 @pytest.mark.unit
-def test_wave_number_inversely_proportional_to_wavelength():
+def test_wave_number_inversely_proportional_to_wavelength(plane_wave, wave_factory):
     """Test that wave number is inversely proportional to wavelength."""
-    amplitude = 1.0 + 0.0j
-    wave1 = PlaneWave(amplitude, wave_number=5.0)
-    wave2 = PlaneWave(amplitude, wave_number=10.0)
+    wave1 = plane_wave
+    wave2 = wave_factory(10.0)
 
     k1 = wave1.wave_number
     k2 = wave2.wave_number
 
-    assert np.isclose(k2 / k1, 2.0)
+    assert math.isclose(k2 / k1, 2.0)
 
 
 @pytest.mark.unit
-def test_dispersion_relation():
+def test_dispersion_relation(plane_wave_bundle):
     """Test basic dispersion relation: E = ħω = ħ²k²/(2m)."""
-    amplitude = 1.0 + 0.0j
-    wave_number = 5.0
-    masse = ELECTRON_MASS
-    wave = PlaneWave(amplitude, wave_number, masse=masse)
-
-    k = wave.wave_number
-    omega = wave.angular_frequency
-
-    expected_omega = (REDUCED_PLANCK_CONSTANT * k**2) / (2 * masse)
-
-    assert np.isclose(omega, expected_omega)
+    wave = plane_wave_bundle.wave
 
-
-@pytest.mark.unit
-def test_wave_number_and_angular_frequency_consistency():
-    """Test consistency between wave number and angular frequency."""
-    amplitude = 1.0 + 0.0j
-    wave_number = 8.0
-    masse = ELECTRON_MASS
-    wave = PlaneWave(amplitude, wave_number, masse=masse)
-
-    k = wave.wave_number
-    omega = wave.angular_frequency
-
-    calculated_omega = (REDUCED_PLANCK_CONSTANT * k**2) / (2 * masse)
-
-    assert np.isclose(omega, calculated_omega)
+    assert math.isclose(wave.energy, REDUCED_PLANCK_CONSTANT * wave.angular_frequency)
 
 
 # ========================
@@ -407,44 +294,34 @@ def test_wave_number_and_angular_frequency_consistency():
 
 
 @pytest.mark.unit
-def test_evaluate_single_point():
+def test_evaluate_single_point(canonical_wave):
     """Test evaluate with a single point returns correct wave value."""
-    amplitude = 1.0
-    wave_number = 1
-    position = 0.0
-    phase = 0.0
-    time = 0.0
-
-    wave = PlaneWave(amplitude, wave_number, position, phase, time)
-
-    result = wave.evaluate(0.0)
+    result = canonical_wave.evaluate(0.0)
     expected = 1.0 + 0.0j
 
-    assert np.isclose(result, expected, atol=1e-14)
+    assert cmath.isclose(result, expected, abs_tol=1e-14)
 
 
 @pytest.mark.unit
-def test_evaluate_multiple_points():
+def test_evaluate_multiple_points(canonical_wave, eval_grid_5):
     """Test evaluate with multiple points returns array of correct length."""
-    amplitude = 1.0
-    wave_number = 2.0
-    position = 0.0
-    phase = 0.0
-    time = 0.0
-
-    wave = PlaneWave(amplitude, wave_number, position, phase, time)
-
-    x_values = np.array([0.0, 0.5, 1.0, 1.5, 2.0])
+    wave = canonical_wave
+    x_values = eval_grid_5
     result = wave.evaluate(x_values)
 
-    # Verify result is array
-    assert isinstance(result, np.ndarray)
+    # Verify result is a plain array, not a subclass
+    assert type(result) is np.ndarray
     assert result.shape == x_values.shape
     assert len(result) == 5
 
+    # One vectorized call checked against the closed form, and against the
+    # scalar path on a single sample rather than point by point
+    assert np.allclose(result, np.exp(1j * x_values), atol=1e-14)
+    assert cmath.isclose(wave.evaluate(x_values[2]), result[2], abs_tol=1e-14)
+
 
 @pytest.mark.unit
-def test_evaluate_preserves_amplitude():
+def test_evaluate_preserves_amplitude(grid_linspace_100, assert_complex_close):
     """Test that amplitude magnitude is preserved at all positions."""
     amplitude = 2.0
     wave_number = 5.0
@@ -454,13 +331,35 @@ def test_evaluate_preserves_amplitude():
 
     wave = PlaneWave(amplitude, wave_number, position, phase, time)
 
-    x_values = np.linspace(0, 10, 100)
-    result = wave.evaluate(x_values)
+    result = wave.evaluate(grid_linspace_100)
     magnitudes = np.abs(result)
 
     # All magnitudes should equal |amplitude|
-    expected_magnitude = np.abs(amplitude)
-    assert np.allclose(magnitudes, expected_magnitude, atol=1e-14)
+    expected_magnitude = abs(amplitude)
+    assert_complex_close(magnitudes, expected_magnitude, tol=1e-14)
+
+
+@pytest.mark.unit
+def test_vectorized_evaluation(plane_wave, grid_linspace_256):
+    """Test that evaluate maps a grid to a complex array of the same length."""
+    result = plane_wave.evaluate(grid_linspace_256)
+
+    assert result.shape == grid_linspace_256.shape
+    assert result.dtype == complex
+
+
+@pytest.mark.unit
+@pytest.mark.slow
+def test_vectorized_very_large_array(
+    plane_wave, grid_linspace_10k, assert_complex_close
+):
+    """Test evaluate on a large grid against the closed form on a subsample."""
+    result = plane_wave.evaluate(grid_linspace_10k)
+
+    assert result.shape == grid_linspace_10k.shape
+    sample = grid_linspace_10k[::97]
+    expected = np.exp(1j * plane_wave.wave_number * sample)
+    assert_complex_close(result[::97], expected)
 
 
 @pytest.mark.unit
@@ -476,9 +375,9 @@ def test_evaluate_with_position_offset():
 
     # At x = position, the spatial term (x - x0) = 0
     result_at_offset = wave.evaluate(position)
-    expected = amplitude * np.exp(1j * phase)
+    expected = amplitude * cmath.exp(1j * phase)
 
-    assert np.isclose(result_at_offset, expected, atol=1e-14)
+    assert cmath.isclose(result_at_offset, expected, abs_tol=1e-14)
 
 
 @pytest.mark.unit
@@ -496,7 +395,7 @@ def test_evaluate_with_phase_shift():
     result = wave.evaluate(0.0)
     expected = 1.0j
 
-    assert np.isclose(result, expected, atol=1e-14)
+    assert cmath.isclose(result, expected, abs_tol=1e-14)
 
 @pytest.mark.unit
 def test_evaluate_complex_amplitude():
@@ -510,6 +409,133 @@ def test_evaluate_complex_amplitude():
     wave = PlaneWave(amplitude, wave_number, position, phase, time)
 
     result = wave.evaluate(0.0)
-    expected = (1.0 + 1.0j) * np.exp(0.0j)
+    expected = amplitude * cmath.exp(1j * phase)
+
+    assert cmath.isclose(result, expected, abs_tol=1e-14)
+
+
+@pytest.mark.unit
+def test_evaluate_into_out_buffer(plane_wave, grid_linspace_11):
+    """Test that evaluate writes into and returns a caller-owned buffer."""
+    x = grid_linspace_11
+    out = np.empty(x.shape, dtype=complex)
+
+    result = plane_wave.evaluate(x, out=out)
+
+    assert result is out
+    assert np.allclose(out, plane_wave.evaluate(x))
+
+    assert plane_wave.evaluate_at_time_zero(x, out=out) is out
+    assert np.allclose(out, plane_wave.evaluate_at_time_zero(x))
+    assert plane_wave.evaluate_at_position_zero(x, out=out) is out
+    assert np.allclose(out, plane_wave.evaluate_at_position_zero(x))
+
+
+@pytest.mark.unit
+def test_evaluate_rejects_mismatched_out_buffer(plane_wave, grid_linspace_11):
+    """Test that evaluate refuses an out buffer of the wrong shape or dtype."""
+    x = grid_linspace_11
+    with pytest.raises(ValueError, match="out"):
+        plane_wave.evaluate(x, out=np.empty(10, dtype=complex))
+    with pytest.raises(ValueError, match="out"):
+        plane_wave.evaluate(x, out=np.empty(11))
+
+
+@pytest.mark.unit
+def test_scalar_evaluation_matches_array_path(plane_wave):
+    """Test that the Python-scalar fast path agrees with the NumPy path."""
+    scalar = plane_wave.evaluate(0.3)
+    vector = plane_wave.evaluate(np.array([0.3]))
+
+    assert type(scalar) is complex
+    assert cmath.isclose(scalar, vector[0], abs_tol=1e-14)
+    for x in (np.float64(0.3), np.array(0.3)):
+        assert type(plane_wave.evaluate(x)) is complex
+    assert cmath.isclose(
+        plane_wave.evaluate_at_time_zero(2),
+        plane_wave.evaluate_at_time_zero(np.array(2.0)),
+        abs_tol=1e-14,
+    )
+
+
+@pytest.mark.unit
+def test_evaluate_spacetime_matches_evaluate_at_each_time(eval_grid_5):
+    """Test that each column of the space-time grid is evaluate at that time."""
+    times = np.array([0.0, 1e-3, 2.5e-2])
+    params = dict(amplitude=2.0 - 1.0j, wave_number=3.0, position=0.4, phase=0.2)
+    wave = PlaneWave(**params)
+
+    grid = wave.evaluate_spacetime(eval_grid_5, times)
+
+    assert grid.shape == (eval_grid_5.size, times.size)
+    for j, t in enumerate(times):
+        expected = PlaneWave(**params, time=t).evaluate(eval_grid_5)
+        assert np.allclose(grid[:, j], expected, atol=1e-12)
+
+    out = np.empty_like(grid)
+    assert wave.evaluate_spacetime(eval_grid_5, times, out=out) is out
+    with pytest.raises(ValueError, match="out"):
+        wave.evaluate_spacetime(eval_grid_5, times, out=np.empty(grid.shape))
+
+
+@pytest.mark.unit
+def test_evaluate_spacetime_keeps_dtype_for_scalar_axes(plane_wave, eval_grid_5):
+    """Test that a scalar x or t does not promote a complex64 grid."""
+    column = plane_wave.evaluate_spacetime(eval_grid_5, 1e-3, dtype=np.complex64)
+    row = plane_wave.evaluate_spacetime(0.5, eval_grid_5, dtype=np.complex64)
+
+    assert column.dtype == np.complex64
+    assert column.shape == eval_grid_5.shape
+    assert row.dtype == np.complex64
+    assert row.shape == eval_grid_5.shape
+    reference = plane_wave.evaluate_spacetime(eval_grid_5, np.array([1e-3]))
+    assert np.allclose(column, reference[:, 0], atol=1e-5)
+
+
+@pytest.mark.unit
+def test_evaluate_in_single_precision(plane_wave, grid_linspace_11):
+    """Test the complex64 option of the evaluation methods."""
+    single = plane_wave.evaluate(grid_linspace_11, dtype=np.complex64)
+
+    assert single.dtype == np.complex64
+    assert np.allclose(single, plane_wave.evaluate(grid_linspace_11), atol=1e-5)
+    assert plane_wave.evaluate_at_time_zero(
+        grid_linspace_11, dtype=np.complex64
+    ).dtype == np.complex64
+    assert plane_wave.evaluate_at_position_zero(
+        grid_linspace_11, dtype=np.complex64
+    ).dtype == np.complex64
+    with pytest.raises(ValueError, match="complex"):
+        plane_wave.evaluate(grid_linspace_11, dtype=np.float64)
+
+
+def _reference_scalar_eval(method, values):
+    """Evaluate method point by point, as a reference for the vector path."""
+    return np.fromiter(
+        (method(float(v)) for v in values), dtype=np.complex128, count=len(values)
+    )
+
+
+@pytest.mark.unit
+def test_evaluate_at_time_zero_multiple_positions(plane_wave, eval_grid_5):
+    """Test that evaluate_at_time_zero agrees with evaluate at t = 0."""
+    result = plane_wave.evaluate_at_time_zero(eval_grid_5)
+
+    reference = _reference_scalar_eval(plane_wave.evaluate_at_time_zero, eval_grid_5)
+    assert np.allclose(result, reference, atol=1e-14)
+    assert np.allclose(result, plane_wave.evaluate(eval_grid_5), atol=1e-14)
+
+
+@pytest.mark.unit
+def test_evaluate_at_position_zero_multiple_times():
+    """Test that evaluate_at_position_zero agrees with evaluate at x = 0."""
+    params = dict(amplitude=1.0 - 2.0j, wave_number=4.0, position=0.3, phase=0.7)
+    wave = PlaneWave(**params)
+    times = np.array([0.0, 1e-4, 5e-3, 2e-2])
+
+    result = wave.evaluate_at_position_zero(times)
 
-    assert np.isclose(result, expected, atol=1e-14)
+    reference = _reference_scalar_eval(wave.evaluate_at_position_zero, times)
+    assert np.allclose(result, reference, atol=1e-14)
+    expected = [PlaneWave(**params, time=t).evaluate(0.0) for t in times]
+    assert np.allclose(result, expected, atol=1e-12)
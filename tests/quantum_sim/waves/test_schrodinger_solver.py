@@ -3,6 +3,9 @@ import pytest
 
 from quantum_sim.waves import PlaneWave, SchrodingerSolver, WavePacket
 import quantum_sim.waves.schrodinger_solver as solver_module
+from quantum_sim.potentials.FreePotential import FreePotential
+from quantum_sim.potentials.StepPotential import StepPotential
+from quantum_sim.utils.constants import REDUCED_PLANCK_CONSTANT
 
 
 @pytest.fixture
@@ -47,7 +50,7 @@ def test_build_laplacian_has_expected_shape_and_stencil(solver):
     expected[center] = -2.0 / solver.dx**2
     expected[center + 1] = 1.0 / solver.dx**2
 
-    assert np.allclose(row, expected)
+    np.testing.assert_allclose(row, expected)
 
 
 @pytest.mark.unit
@@ -68,7 +71,7 @@ def test_cap_is_all_zero_when_absorbing_boundaries_disabled():
         n_points=51,
         absorbing_boundaries=False,
     )
-    assert np.allclose(no_cap_solver._cap, 0.0)
+    assert not no_cap_solver._cap.any()
 
 
 @pytest.mark.unit
@@ -81,7 +84,29 @@ def test_set_potential_validates_shape(solver):
 def test_set_potential_accepts_valid_array(solver):
     V = np.linspace(0.0, 1.0, solver.n_points)
     solver.set_potential(V)
-    assert np.allclose(solver._V, V)
+    assert np.array_equal(solver._V, V)
+    assert not solver._V_is_zero
+
+
+@pytest.mark.unit
+def test_set_potential_copies_input_array(solver):
+    V = np.zeros(solver.n_points)
+    solver.set_potential(V)
+    V[20:30] = 1e-30
+
+    assert solver._V_is_zero
+    assert not solver._V.any()
+
+
+@pytest.mark.unit
+def test_set_potential_accepts_potential_objects(solver):
+    solver.set_potential(StepPotential(x0=0.0, V0=2.0))
+    assert np.array_equal(solver._V, np.where(solver.x_grid >= 0.0, 2.0, 0.0))
+    assert not solver._V_is_zero
+
+    solver.set_potential(FreePotential())
+    assert solver._V_is_zero
+    assert not solver._V.any()
 
 
 @pytest.mark.unit
@@ -110,7 +135,7 @@ def test_init_from_array_without_normalization_keeps_values(solver):
     psi0 = np.linspace(0.0, 1.0, solver.n_points) + 1j * np.linspace(1.0, 0.0, solver.n_points)
     solver.init_from_array(psi0, normalize=False)
 
-    assert np.allclose(solver._psi_0, psi0)
+    assert np.array_equal(solver._psi_0, psi0)
 
 
 @pytest.mark.unit
@@ -131,6 +156,30 @@ def test_rhs_returns_expected_shape_and_dtype(solver):
     assert np.iscomplexobj(rhs)
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize("V_scale", [0.0, 1e-33], ids=["zero-V", "nonzero-V"])
+def test_rhs_matches_schrodinger_equation(solver, V_scale):
+    hbar = REDUCED_PLANCK_CONSTANT
+    V = V_scale * np.linspace(0.0, 1.0, solver.n_points)
+    solver.set_potential(V)
+    psi = np.exp(-0.5 * (solver.x_grid / 2.0) ** 2) * np.exp(1j * solver.x_grid)
+
+    rhs = solver._rhs(0.0, psi)
+
+    T_psi = -(hbar**2 / (2.0 * solver.mass)) * (solver._laplacian.toarray() @ psi)
+    expected = (-1j / hbar) * (T_psi + V * psi) - solver._cap * psi
+    np.testing.assert_allclose(rhs, expected, rtol=1e-12)
+
+
+@pytest.mark.unit
+def test_rhs_accepts_real_psi(solver):
+    psi = np.exp(-0.5 * (solver.x_grid / 2.0) ** 2)
+
+    rhs = solver._rhs(0.0, psi)
+
+    np.testing.assert_allclose(rhs, solver._rhs(0.0, psi.astype(complex)), rtol=1e-12)
+
+
 @pytest.mark.unit
 def test_solve_raises_if_initial_state_not_set(solver):
     with pytest.raises(RuntimeError, match="Initial state"):
@@ -176,7 +225,7 @@ def test_solve_returns_expected_result_shapes(solver):
     assert result["t"].shape == (3,)
     assert result["psi"].shape == (solver.n_points, 3)
     assert result["prob"].shape == (solver.n_points, 3)
-    assert np.allclose(result["prob"], np.abs(result["psi"]) ** 2)
+    np.testing.assert_allclose(result["prob"], np.abs(result["psi"]) ** 2)
 
 
 @pytest.mark.unit
@@ -13,9 +13,11 @@ def plane_waves():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def x_grid():
-    return np.linspace(-10, 10, 1000)
+    grid = np.linspace(-10, 10, 1000)
+    grid.flags.writeable = False
+    return grid
 
 
 @pytest.fixture
@@ -29,12 +31,70 @@ def test_wave_packet_creation(wave_packet):
     assert len(wave_packet.plane_waves) == 2
 
 
-# @pytest.mark.unit
-# def test_wave_packet_is_sum_of_plane_waves(wave_packet, plane_waves, x_grid):
-#     psi_packet = wave_packet.evaluate(x_grid)
-#     psi_sum = sum(pw.evaluate(x_grid) for pw in plane_waves)
+@pytest.mark.unit
+def test_wave_packet_has_no_instance_dict(wave_packet):
+    assert not hasattr(wave_packet, "__dict__")
+
+
+@pytest.mark.unit
+def test_wave_packet_is_sum_of_plane_waves(
+    wave_packet, plane_waves, x_grid, assert_complex_close
+):
+    psi_packet = wave_packet.evaluate(x_grid)
+    psi_sum = sum(pw.evaluate(x_grid) for pw in plane_waves)
+
+    assert_complex_close(psi_packet, psi_sum)
+
+
+@pytest.mark.unit
+def test_wave_packet_at_later_time_is_sum_of_plane_waves(x_grid, assert_complex_close):
+    t = 2e-3
+    params = [(1.0, 1.0, 0.5, 0.1), (0.5 - 0.5j, 2.0, -1.0, 0.0), (2.0, 3.5, 0.0, 1.2)]
+    packet = WavePacket([PlaneWave(a, k, x0, phi) for a, k, x0, phi in params])
+    later = [PlaneWave(a, k, x0, phi, time=t) for a, k, x0, phi in params]
+
+    psi_packet = packet.evaluate(x_grid, t)
+    psi_sum = sum(pw.evaluate(x_grid) for pw in later)
+
+    assert_complex_close(psi_packet, psi_sum)
+
+
+@pytest.mark.unit
+def test_evaluate_spacetime_matches_evaluate_at_each_time(
+    wave_packet, x_grid, assert_complex_close
+):
+    times = np.array([0.0, 1e-3, 2e-3, 5e-2])
+    wave_packet.normalize(-10, 10, 200)
+
+    grid = wave_packet.evaluate_spacetime(x_grid, times)
+
+    assert grid.shape == (x_grid.size, times.size)
+    for j, t in enumerate(times):
+        assert_complex_close(grid[:, j], wave_packet.evaluate(x_grid, t))
+
+
+@pytest.mark.unit
+def test_evaluate_in_single_precision(wave_packet, x_grid):
+    single = wave_packet.evaluate(x_grid, dtype=np.complex64)
+
+    assert single.dtype == np.complex64
+    assert np.allclose(single, wave_packet.evaluate(x_grid), atol=1e-5)
+    times = np.array([0.0, 1e-3])
+    grid = wave_packet.evaluate_spacetime(x_grid, times, dtype=np.complex64)
+    assert grid.dtype == np.complex64
+    with pytest.raises(ValueError, match="complex"):
+        wave_packet.evaluate(x_grid, dtype=np.float64)
+
+
+@pytest.mark.unit
+def test_normalized_packet_keeps_single_precision(wave_packet, x_grid):
+    wave_packet.normalize(-10, 10, 200)
+
+    single = wave_packet.evaluate(x_grid, dtype=np.complex64)
 
-#     assert np.allclose(psi_packet, psi_sum)
+    assert single.dtype == np.complex64
+    assert np.allclose(single, wave_packet.evaluate(x_grid), atol=1e-5)
+    assert wave_packet.evaluate(0.5, dtype=np.complex64).dtype == np.complex64
 
 
 @pytest.mark.unit
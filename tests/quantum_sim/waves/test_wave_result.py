@@ -20,9 +20,9 @@ def test_wave_result_creation(wave_result_data):
     x, psi, t, metadata = wave_result_data
     result = WaveResult(x=x, psi=psi, t=t, metadata=metadata)
 
-    assert (result.x == x).all()
-    assert (result.psi == psi).all()
-    assert (result.t == t).all()
+    assert np.array_equal(result.x, x)
+    assert np.array_equal(result.psi, psi)
+    assert np.array_equal(result.t, t)
     assert result.metadata == metadata
 
 
@@ -42,9 +42,9 @@ def test_wave_result_copy(wave_result_data):
 
     result_copy = result.copy()
 
-    assert (result_copy.x == result.x).all()
-    assert (result_copy.psi == result.psi).all()
-    assert (result_copy.t == result.t).all()
+    assert np.array_equal(result_copy.x, result.x)
+    assert np.array_equal(result_copy.psi, result.psi)
+    assert np.array_equal(result_copy.t, result.t)
     assert result_copy.metadata == result.metadata
     assert result_copy is not result
 
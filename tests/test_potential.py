@@ -4,6 +4,7 @@ from quantum_sim.potentials.Potential import Potential
 from quantum_sim.potentials.FreePotential import FreePotential
 from quantum_sim.potentials.StepPotential import StepPotential
 from quantum_sim.potentials.InfiniteWell import InfiniteWell
+from quantum_sim.potentials.batch import evaluate_steps, evaluate_wells, evaluate_many
 
 
 class TestPotentialCreation:
@@ -23,6 +24,14 @@ class TestPotentialCreation:
         V_vals = pot.evaluate(x_vals)
         np.testing.assert_array_equal(V_vals, np.zeros_like(x_vals))
 
+    def test_free_potential_returns_zero_stride_view(self):
+        """Test that FreePotential allocates nothing for the grid."""
+        x_vals = np.linspace(-1.0, 1.0, 1000)
+        V_vals = FreePotential().evaluate(x_vals)
+        assert V_vals.shape == x_vals.shape
+        assert V_vals.strides == (0,)
+        assert not V_vals.flags.writeable
+
     def test_step_potential_creation(self):
         """Test StepPotential instantiation."""
         x0, V0 = 2.0, 5.0
@@ -43,6 +52,13 @@ class TestPotentialCreation:
         expected = np.array([0.0, 0.0, V0, V0, V0])
         np.testing.assert_array_equal(V_vals, expected)
 
+    @pytest.mark.parametrize("V0", [np.inf, -np.inf])
+    def test_step_potential_infinite_height(self, V0):
+        """Test that an infinite step stays 0 below x0 instead of nan."""
+        pot = StepPotential(x0=0.0, V0=V0)
+        V_vals = pot.evaluate(np.array([-1.0, 0.0, 1.0]))
+        np.testing.assert_array_equal(V_vals, [0.0, V0, V0])
+
     def test_infinite_well_creation(self):
         """Test InfiniteWell instantiation."""
         a, b, V_wall = -1.0, 1.0, 1e10
@@ -69,3 +85,126 @@ class TestPotentialCreation:
         V_vals = pot.evaluate(x_vals)
         expected = np.array([V_wall, 0.0, 0.0, 0.0, V_wall])
         np.testing.assert_array_equal(V_vals, expected)
+
+    def test_infinite_well_nan_position_gets_wall(self):
+        """Test that a nan position is treated as outside the well."""
+        pot = InfiniteWell(a=-1.0, b=1.0, V_wall=7.0)
+        x_vals = np.array([np.nan, 0.0])
+        np.testing.assert_array_equal(pot.evaluate(x_vals), [7.0, 0.0])
+        np.testing.assert_array_equal(pot.make_kernel()(x_vals), [7.0, 0.0])
+        assert pot.make_kernel()(float("nan")) == 7.0
+        np.testing.assert_array_equal(
+            evaluate_wells(x_vals, [-1.0], [1.0], [7.0]), [[7.0, 0.0]]
+        )
+
+
+class TestBatchEvaluation:
+    """Test evaluation of several potentials on a shared grid."""
+
+    def test_evaluate_steps_matches_individual_potentials(self):
+        """Test evaluate_steps against StepPotential.evaluate."""
+        x_vals = np.linspace(-2.0, 4.0, 13)
+        x0s, V0s = [0.0, 1.0, 2.5], [1.0, 5.0, -3.0]
+        V_vals = evaluate_steps(x_vals, x0s, V0s)
+        assert V_vals.shape == (3, x_vals.size)
+        for row, x0, V0 in zip(V_vals, x0s, V0s):
+            np.testing.assert_array_equal(row, StepPotential(x0, V0).evaluate(x_vals))
+
+    def test_evaluate_wells_matches_individual_potentials(self):
+        """Test evaluate_wells against InfiniteWell.evaluate."""
+        x_vals = np.array([-2.0, -1.0, 0.0, 0.5, 1.0, 2.0])
+        a_vals, b_vals, walls = [-1.0, 0.0], [1.0, 0.5], [1e10, 7.0]
+        V_vals = evaluate_wells(x_vals, a_vals, b_vals, walls)
+        for row, a, b, V_wall in zip(V_vals, a_vals, b_vals, walls):
+            np.testing.assert_array_equal(
+                row, InfiniteWell(a, b, V_wall).evaluate(x_vals)
+            )
+
+    def test_evaluate_many_keeps_input_order(self):
+        """Test evaluate_many on a mix of potential types."""
+        x_vals = np.linspace(-3.0, 3.0, 7)
+        potentials = [
+            InfiniteWell(-1.0, 1.0, 10.0),
+            FreePotential(),
+            StepPotential(0.0, 2.0),
+            InfiniteWell(0.0, 2.0, 3.0),
+        ]
+        V_vals = evaluate_many(potentials, x_vals)
+        expected = np.array([pot.evaluate(x_vals) for pot in potentials])
+        np.testing.assert_array_equal(V_vals, expected)
+
+    def test_evaluate_many_with_infinite_heights(self):
+        """Test that infinite walls and steps give 0, not nan, elsewhere."""
+        x_vals = np.linspace(-3.0, 3.0, 7)
+        potentials = [
+            InfiniteWell(-1.0, 1.0, np.inf),
+            StepPotential(0.0, np.inf),
+            InfiniteWell(0.0, 2.0, 3.0),
+            StepPotential(1.0, 2.0),
+        ]
+        V_vals = evaluate_many(potentials, x_vals)
+        expected = np.array([pot.evaluate(x_vals) for pot in potentials])
+        assert not np.isnan(V_vals).any()
+        np.testing.assert_array_equal(V_vals, expected)
+
+
+class TestEvaluationDtype:
+    """Test the dtype of potential evaluations."""
+
+    @pytest.mark.parametrize(
+        "pot",
+        [FreePotential(), StepPotential(x0=0.0, V0=5.0), InfiniteWell(a=-1.0, b=1.0)],
+    )
+    def test_result_dtype_follows_grid(self, pot):
+        """Test that float32 grids give float32 potentials unless overridden."""
+        x_vals = np.linspace(-2.0, 2.0, 5, dtype=np.float32)
+        assert pot.evaluate(x_vals).dtype == np.float32
+        assert pot.evaluate(x_vals, dtype=np.float64).dtype == np.float64
+        for int_dtype in (int, np.int8, np.int16, bool):
+            assert pot.evaluate(x_vals.astype(int_dtype)).dtype == np.float64
+
+    def test_infinite_well_wall_saturates_in_narrow_dtype(self):
+        """Test that a wall too large for the dtype becomes inf, not nan."""
+        pot = InfiniteWell(a=-1.0, b=1.0, V_wall=1e10)
+        V_vals = pot.evaluate(np.array([-2.0, 0.0, 2.0]), dtype=np.float16)
+        np.testing.assert_array_equal(V_vals, [np.inf, 0.0, np.inf])
+
+
+class TestKernels:
+    """Test the closures returned by make_kernel."""
+
+    @pytest.mark.parametrize(
+        "pot",
+        [
+            FreePotential(),
+            StepPotential(x0=0.5, V0=5.0),
+            StepPotential(x0=0.5, V0=np.inf),
+            InfiniteWell(a=-1.0, b=1.0),
+            InfiniteWell(a=-1.0, b=1.0, V_wall=np.inf),
+        ],
+        ids=["free", "step", "infinite-step", "well", "infinite-well"],
+    )
+    def test_kernel_matches_evaluate(self, pot):
+        """Test that the kernel gives the same values as evaluate."""
+        kernel = pot.make_kernel()
+        x_vals = np.linspace(-2.0, 2.0, 9)
+        np.testing.assert_array_equal(kernel(x_vals), pot.evaluate(x_vals))
+        assert kernel(0.75) == pot.evaluate(0.75)
+
+    @pytest.mark.parametrize(
+        "pot", [StepPotential(x0=0.5, V0=5), InfiniteWell(a=-1.0, b=1.0, V_wall=7)]
+    )
+    def test_kernel_returns_python_float_for_python_scalars(self, pot):
+        """Test the scalar fast path against the array path at and around each edge."""
+        kernel = pot.make_kernel()
+        for x in (-2.0, -1, 0.0, 0.5, 1, 2.0):
+            value = kernel(x)
+            assert type(value) is float
+            assert value == kernel(np.array([x]))[0]
+
+    def test_kernel_captures_parameters_at_creation(self):
+        """Test that later parameter changes do not leak into a kernel."""
+        pot = StepPotential(x0=0.0, V0=1.0)
+        kernel = pot.make_kernel()
+        pot.V0 = 2.0
+        assert kernel(1.0) == 1.0